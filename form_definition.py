@@ -1,7 +1,100 @@
 import json
 import logging
-from jsonschema import validate, ValidationError
-from datetime import datetime
+import re
+import sqlite3
+import sys
+import fastjsonschema
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from jsonschema import Draft4Validator, Draft6Validator, Draft7Validator, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+from datetime import date, datetime, time
+
+# The same patterns datetime.strptime builds for the "%Y-%m-%d", "%H:%M:%S" and "%Y-%m-%dT%H:%M:%S" formats
+_DATE_PATTERN = r"(?P<Y>\d\d\d\d)-(?P<m>1[0-2]|0[1-9]|[1-9])-(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])"
+_TIME_PATTERN = r"(?P<H>2[0-3]|[0-1]\d|\d):(?P<M>[0-5]\d|\d):(?P<S>6[0-1]|[0-5]\d|\d)"
+_DATE_RE = re.compile(_DATE_PATTERN, re.IGNORECASE)
+_TIME_RE = re.compile(_TIME_PATTERN, re.IGNORECASE)
+_DATE_TIME_RE = re.compile(f"{_DATE_PATTERN}T{_TIME_PATTERN}", re.IGNORECASE)
+# C-implemented parsers for the canonical zero-padded forms of the formats above
+_date_fromisoformat = date.fromisoformat
+_time_fromisoformat = time.fromisoformat
+_datetime_fromisoformat = datetime.fromisoformat
+
+# Number of recently parsed date/time answers remembered per question
+_PARSED_VALUES_CACHE_SIZE = 1024
+
+# Bits of the data types in the per-question masks used by FormDefinition.question_includes_datatype
+_TYPE_BITS = {"boolean": 1, "null": 2, "enum": 4, "integer": 8, "number": 16, "string": 32, "date": 64, "time": 128, "date-time": 256}
+
+def _compile_schema_validator(schema):
+    """
+    Return a checked and compiled validation function for the given schema, raising ValidationError for invalid instances.
+
+    fastjsonschema is used for the drafts it supports (04, 06 and 07), newer drafts fall back to a pre-built jsonschema validator.
+    """
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    if cls in (Draft4Validator, Draft6Validator, Draft7Validator):
+        # Formats are not asserted, the same as jsonschema does by default, they are checked by the Form* options
+        fast_validate = fastjsonschema.compile(schema, use_formats=False)
+
+        def validate(instance):
+            try:
+                fast_validate(instance)
+            except fastjsonschema.JsonSchemaException as e:
+                raise ValidationError(e.message) from e
+
+        return validate
+
+    validator = cls(schema)
+
+    def validate(instance):
+        error = best_match(validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+    return validate
+
+
+def _check_fragment(context, text, start):
+    """Validate an answer text fragment's format and presence in context at the given start index."""
+    if not isinstance(text, str) or not isinstance(start, int):
+        raise ValueError(f"Answer text '{text}' must be a string and start '{start}' must be an integer.")
+    if not (len(text) >= 1 and start >= 0):
+        raise ValueError(f"Answer text '{text}' must be non-empty and start index '{start}' must be valid.")
+    if not context.startswith(text, start, start + len(text)):
+        raise ValueError(f"Answer text '{text}' not found in context at position '{start}'.")
+
+
+class _LargeIdSet:
+    """
+    Set of question-answer IDs for very large datasets, stored in a temporary on-disk SQLite table instead of memory.
+
+    A scalable Bloom filter answers the (common) negative membership checks in memory, only its probable hits are confirmed on disk.
+    """
+
+    def __init__(self):
+        # pybloom_live is needed only for the large datasets
+        from pybloom_live import ScalableBloomFilter
+
+        self._bloom = ScalableBloomFilter(initial_capacity=10_000_000, error_rate=1e-7)
+        # An empty database name opens a private temporary on-disk database, deleted once closed
+        self._db = sqlite3.connect("")
+        self._db.execute("CREATE TABLE ids (id TEXT PRIMARY KEY)")
+
+    def __contains__(self, qa_id):
+        return qa_id in self._bloom and self._db.execute("SELECT 1 FROM ids WHERE id = ?", (qa_id,)).fetchone() is not None
+
+    def isdisjoint(self, qa_ids):
+        return not any(qa_id in self for qa_id in qa_ids)
+
+    def update(self, qa_ids):
+        for qa_id in qa_ids:
+            self._bloom.add(qa_id)
+        self._db.executemany("INSERT OR IGNORE INTO ids (id) VALUES (?)", ((qa_id,) for qa_id in qa_ids))
+
 
 class FormDefinition:
     """Class to define and validate forms based on a given JSON schema."""
@@ -13,30 +106,51 @@ class FormDefinition:
         Args:
             schema_path (str): The path to the JSON schema file. Defaults to "./resources/schema_3_1_7.json".
         """
+        self.schema_path = schema_path
         with open(schema_path, 'r') as file:
             self.schema = json.load(file)
+        self._validate_schema = _compile_schema_validator(self.schema)
 
         # Set to store all question IDs and their possible options
         self.question_ids = set()
         self.possible_options = {}
+        # The same possible options split into plain literals and Form* options keyed by their type
+        self._option_buckets = {}
         self._extract_question_ids(self.schema, '')
+        # Question IDs are fixed from now on, intern them to make the hot lookups cheaper
+        self.question_ids = frozenset(sys.intern(question_id) for question_id in self.question_ids)
+        self.possible_options = {sys.intern(question_id): options for question_id, options in self.possible_options.items()}
+        self._option_buckets = {sys.intern(question_id): bucket for question_id, bucket in self._option_buckets.items()}
+
+        # Split question IDs (parent object names, property name) used to build the answers tree
+        self._qid_paths = {}
+        for question_id in self.question_ids:
+            *parents, name = question_id.split(".")
+            self._qid_paths[question_id] = (tuple(parents), name)
+
+        # Value validators specialized for the Form* options of each question
+        self._validators_by_qid = {
+            question_id: FormDefinition._build_value_validator(bucket)
+            for question_id, bucket in self._option_buckets.items()
+        }
+        # Data types included in the possible options of each question, as bitmasks of _TYPE_BITS
+        self._dtype_masks = {
+            question_id: FormDefinition._build_dtype_mask(bucket)
+            for question_id, bucket in self._option_buckets.items()
+        }
 
     def _extract_question_ids(self, data, base_id):
         """
-        Recursively loads question IDs and their possible options from the schema data.
+        Loads question IDs and their possible options from the schema data, walking it depth-first with an explicit stack.
 
         Args:
             data (dict or list): The schema data to parse.
             base_id (str): The base ID used for constructing question IDs.
-        """        
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if key == "properties":
-                    for prop_id in value:
-                        self._extract_question_ids(value[prop_id], f"{base_id}.{prop_id}" if base_id else prop_id)
-                else:
-                    self._extract_question_ids(value, base_id)
-
+        """
+        stack = [(data, base_id)]
+        while stack:
+            data, base_id = stack.pop()
+            if isinstance(data, dict):
                 if "type" in data and data['type'] != 'object':
                     data_types = data["type"] if isinstance(data["type"], list) else [data["type"]]
                     for dtype in data_types:
@@ -46,26 +160,44 @@ class FormDefinition:
                     self._add_options(base_id, FormDefinition._get_data_options("string", data))
                     self.question_ids.add(base_id)
 
-        elif isinstance(data, list):
-            for item in data:
-                self._extract_question_ids(item, base_id)
+                children = []
+                for key, value in data.items():
+                    if key == "properties":
+                        children.extend((value[prop_id], f"{base_id}.{prop_id}" if base_id else prop_id) for prop_id in value)
+                    else:
+                        children.append((value, base_id))
+                # Reversed, so that the children are visited in the schema order
+                stack.extend(reversed(children))
+
+            elif isinstance(data, list):
+                stack.extend((item, base_id) for item in reversed(data))
 
     def _add_options(self, question_id, options):
         """Adds new options for a given question ID."""
         if question_id not in self.possible_options:
             self.possible_options[question_id] = set()
+            self._option_buckets[question_id] = {"literals": set(), "by_type": {}}
+        bucket = self._option_buckets[question_id]
 
         for new_option in options:
-            existing_option = next((opt for opt in self.possible_options[question_id]
-                                    if isinstance(opt, type(new_option)) and not isinstance(opt, str)), None)
-            if isinstance(new_option, (FormInteger, FormNumber)) and existing_option:
+            if not isinstance(new_option, (FormNumber, FormInteger, FormDate, FormDateTime, FormTime, FormString)):
+                bucket["literals"].add(new_option)
+                self.possible_options[question_id].add(new_option)
+                continue
+
+            existing_option = bucket["by_type"].get(type(new_option))
+            if existing_option is None:
+                bucket["by_type"][type(new_option)] = new_option
+                self.possible_options[question_id].add(new_option)
+            elif isinstance(new_option, (FormInteger, FormNumber)):
                 existing_option.minimum = min(
                     existing_option.minimum if existing_option.minimum is not None else float('-inf'),
                     new_option.minimum if new_option.minimum is not None else float('-inf')
                 )
-                existing_option.maximum = max(existing_option.maximum or float('inf'), new_option.maximum or float('inf'))
-            elif not existing_option:
-                self.possible_options[question_id].add(new_option)
+                existing_option.maximum = max(
+                    existing_option.maximum if existing_option.maximum is not None else float('inf'),
+                    new_option.maximum if new_option.maximum is not None else float('inf')
+                )
 
     @staticmethod
     def _get_data_options(data_type, data_property):
@@ -87,18 +219,59 @@ class FormDefinition:
     def _handle_string_format(data_property):
         """Handle specific string formats and return corresponding options."""
         if "format" in data_property and data_property["format"] == "date":
-            return {FormDate()}
+            return {_FORM_DATE}
         elif "format" in data_property and data_property["format"] == "time":
-            return {FormTime()}
+            return {_FORM_TIME}
         elif "format" in data_property and data_property["format"] == "date-time":
-            return {FormDateTime()}
+            return {_FORM_DATE_TIME}
         elif "enum" in data_property:
             enum_options = set()
             for op in data_property["enum"]:
                 enum_options.add(op)
             return enum_options
         else:
-            return {FormString()}
+            return {_FORM_STRING}
+
+    @staticmethod
+    def _build_value_validator(bucket):
+        """Return a function checking whether a value is valid for any of the Form* options in the given bucket."""
+        form_checks = tuple(
+            FormDefinition._cache_parsed_values(op.is_valid) if isinstance(op, (FormDate, FormTime, FormDateTime)) else op.is_valid
+            for op in bucket["by_type"].values()
+        )
+
+        def is_valid(value):
+            for check in form_checks:
+                if check(value):
+                    return True
+            return False
+
+        return is_valid
+
+    @staticmethod
+    def _cache_parsed_values(check):
+        """Wrap a date/time option check with a bounded cache, parsing is costly and the same answers repeat often."""
+        cached_check = lru_cache(maxsize=_PARSED_VALUES_CACHE_SIZE)(check)
+
+        def is_valid(value):
+            # Only strings could be valid dates and times, which also keeps unhashable values out of the cache
+            return isinstance(value, str) and cached_check(value)
+
+        return is_valid
+
+    @staticmethod
+    def _build_dtype_mask(bucket):
+        """Return the bitmask of data types included in the possible options in the given bucket."""
+        mask = 0
+        if True in bucket["literals"] or False in bucket["literals"]:
+            mask |= _TYPE_BITS["boolean"]
+        if None in bucket["literals"]:
+            mask |= _TYPE_BITS["null"]
+        if any(isinstance(op, str) for op in bucket["literals"]):
+            mask |= _TYPE_BITS["enum"]
+        for op in bucket["by_type"].values():
+            mask |= _TYPE_BITS[op.data_type]
+        return mask
 
     def validate_report(self, report, required_fields_validation=True, used_ids=None):
         """
@@ -112,39 +285,60 @@ class FormDefinition:
         Raises:
             Exception: If validation fails at any point.
         """
-        used_ids = used_ids or set()
+        used_ids = used_ids if used_ids is not None else set()
         if len(report["paragraphs"]) != 1:
             raise ValueError(f"Report must contain exactly 1 paragraph, found {len(report['paragraphs'])}.")
 
         paragraph = report["paragraphs"][0]
         context = paragraph["context"]
         
-        # Validate question-answer pairs and their ids
-        for qa in paragraph["qas"]:
-            self._validate_qa(qa, report, used_ids)
+        # Validate question-answer ids format, duplicates and undefined questions
+        self._validate_qa_ids(paragraph["qas"], report, used_ids)
 
-        # Validate evidence text against the context
+        # Validate each question-answer pair in a single pass: its evidence text
+        # against the context and resq form value against possible options
         for qa in paragraph["qas"]:
             self._validate_evidences(qa, context)
-
-        # Validate resq form values against possible options
-        for qa in paragraph["qas"]:
             self._validate_enumeration_value_ids(qa)
 
         # Validate against JSON schema if requested to check the structure correctness (required fields etc..)
         if required_fields_validation:
             self._validate_against_schema(paragraph)
 
-    def _validate_qa(self, qa, report, used_ids):
-        """Validate question-answer pairs for duplicates and ID format."""
+    def _validate_qa(self, qa, report):
+        """Validate question-answer pair ID format."""
         expected_id = f"{report['report_id']}_{qa['question_id']}"
         if qa["id"] != expected_id:
             raise ValueError(f"Question ID '{qa['id']}' does not match expected format '{expected_id}'.")
-        if qa["id"] in used_ids:
-            raise ValueError(f"Duplicate question ID '{qa['id']}' in report '{report['report_id']}'.")
-        if qa["question_id"] not in self.question_ids:
-            raise ValueError(f"Question ID '{qa['question_id']}' is not defined in the schema.")
-        used_ids.add(qa["id"])
+
+    def _validate_qa_ids(self, qas, report, used_ids):
+        """Validate all question-answer pair IDs of a report for their format, duplicates and undefined question IDs."""
+        # The format is checked before any of the IDs could be recorded as used
+        qa_ids = []
+        for qa in qas:
+            self._validate_qa(qa, report)
+            qa_ids.append(qa["id"])
+        try:
+            unique_qa_ids = set(qa_ids)
+            question_ids = {qa["question_id"] for qa in qas}
+        except TypeError:
+            # Unhashable (e.g. list or dict) question IDs, the IDs themselves passed the format check above so are strings
+            question_id = next(qa["question_id"] for qa in qas if not isinstance(qa["question_id"], str))
+            raise ValueError(f"Question ID '{question_id}' is not defined in the schema.")
+
+        if len(unique_qa_ids) != len(qa_ids) or not unique_qa_ids.isdisjoint(used_ids):
+            # Report the first duplicate in the report order
+            seen_ids = set()
+            for qa_id in qa_ids:
+                if qa_id in used_ids or qa_id in seen_ids:
+                    raise ValueError(f"Duplicate question ID '{qa_id}' in report '{report['report_id']}'.")
+                seen_ids.add(qa_id)
+
+        undefined_question_ids = question_ids - self.question_ids
+        if undefined_question_ids:
+            question_id = next(qa["question_id"] for qa in qas if qa["question_id"] in undefined_question_ids)
+            raise ValueError(f"Question ID '{question_id}' is not defined in the schema.")
+        used_ids.update(unique_qa_ids)
 
     def _validate_evidences(self, qa, context):
         """Validate the evidences for correct types and substring matches."""
@@ -158,14 +352,7 @@ class FormDefinition:
 
     def _validate_single_answer(self, answer, context):
         """Validate a single answer's format and presence in context."""
-        text = answer["text"]
-        start = answer["answer_start"]
-        if not isinstance(text, str) or not isinstance(start, int):
-            raise ValueError(f"Answer text '{text}' must be a string and start '{start}' must be an integer.")
-        if not (len(text) >= 1 and start >= 0):
-            raise ValueError(f"Answer text '{text}' must be non-empty and start index '{start}' must be valid.")
-        if context[start:start + len(text)] != text:
-            raise ValueError(f"Answer text '{text}' not found in context at position '{start}'.")
+        _check_fragment(context, answer["text"], answer["answer_start"])
 
     def _validate_complex_answer(self, answer, context):
         """Validate a complex answer's format and substring matches."""
@@ -174,16 +361,21 @@ class FormDefinition:
         if len(answer["text"]) != len(answer["answer_start"]) or len(answer["text"]) <= 1:
             raise ValueError(f"Text '{answer['text']}' and start '{answer['answer_start']}' arrays must be of the same length and contain more than one entry.")
         for text, start in zip(answer["text"], answer["answer_start"]):
-            self._validate_single_answer({"text": text, "answer_start": start}, context)
+            _check_fragment(context, text, start)
 
     def _validate_enumeration_value_ids(self, qa):
         """Validate that the answer values fall within the acceptable options."""
-        is_valid = any(
-            qa["enumeration_value_id"] == op or (isinstance(op, (FormNumber, FormInteger, FormDate, FormDateTime, FormTime, FormString)) and op.is_valid(qa["enumeration_value_id"]))
-            for op in self.possible_options[qa["question_id"]]
-        )
-        
-        if not is_valid:
+        question_id = qa["question_id"]
+        value = qa["enumeration_value_id"]
+        try:
+            # Plain literals (enums, booleans, null) are the common case and need no Form* option checks
+            if value in self._option_buckets[question_id]["literals"]:
+                return
+        except TypeError:
+            # Unhashable values (lists, dicts) cannot be equal to any of the (hashable) literals
+            pass
+
+        if not self._validators_by_qid[question_id](value):
             valid_options = [str(pos_op) for pos_op in self.possible_options[qa["question_id"]]]
             raise ValueError(f"Answer '{qa['enumeration_value_id']}' is not valid for question ID '{qa['question_id']}'. Use one of '{valid_options}'")
 
@@ -191,33 +383,86 @@ class FormDefinition:
         """Validate the answers against the JSON schema."""
         resq_form_answers = {}
         for qa in paragraph["qas"]:
-            parts = qa["question_id"].split(".")
+            parents, name = self._qid_paths[qa["question_id"]]
             current = resq_form_answers
-            for part in parts[:-1]:
+            for part in parents:
                 current = current.setdefault(part, {})
-            current[parts[-1]] = qa["enumeration_value_id"]
-        validate(instance=resq_form_answers, schema=self.schema)
+            current[name] = qa["enumeration_value_id"]
+        self._validate_schema(resq_form_answers)
 
-    def validate_dataset(self, dataset, required_fields_validation=True):
+    def validate_dataset(self, dataset, required_fields_validation=True, num_workers=1, large=False):
         """
         Validate a dataset of reports against the JSON schema, defined questions and defined resq dataset structure.
 
         Args:
             data (dict): The dataset containing multiple reports, in the format of wp4 resq dataset structure.
             required_fields_validation (bool): Whether to validate the structure (required fields etc..) of JSON schema. Defaults to True.
+            num_workers (int): The number of worker processes validating the reports in parallel. Defaults to 1 (no worker processes).
+            large (bool): Whether to keep the used question-answer IDs on disk (behind a Bloom filter) instead of memory. Defaults to False.
         """
-        used_ids = set()
+        reports = dataset["data"]
+        self._log_validation_results(zip(reports, self._validate_reports(reports, required_fields_validation, num_workers)), large)
+
+    def validate_dataset_stream(self, fileobj, required_fields_validation=True, large=False):
+        """
+        Validate a dataset of reports while it is being parsed from a JSON file, without loading the whole dataset into memory.
+
+        Args:
+            fileobj (file): The binary file object with the dataset JSON, in the format of wp4 resq dataset structure.
+            required_fields_validation (bool): Whether to validate the structure (required fields etc..) of JSON schema. Defaults to True.
+            large (bool): Whether to keep the used question-answer IDs on disk (behind a Bloom filter) instead of memory. Defaults to False.
+        """
+        # ijson is needed only for the streamed validation
+        import ijson
+
+        # Numbers are parsed as floats (not Decimals) to validate them the same way as the json module loaded ones
+        reports = ijson.items(fileobj, "data.item", use_float=True)
+        self._log_validation_results(
+            ((report, self._validate_report_isolated(report, required_fields_validation)) for report in reports), large
+        )
+
+    def _log_validation_results(self, results, large=False):
+        """Check duplicates across the validated reports and log the invalid ones, given (report, (qa_ids, error)) pairs."""
+        used_ids = _LargeIdSet() if large else set()
+        report_count = 0
         invalid_report_count = 0
-        for report in dataset["data"]:
-            try:
-                self.validate_report(report, required_fields_validation, used_ids)
-            except ValidationError as e:
-                invalid_report_count += 1
-                logging.error(f"Report '{report['report_id']}' is NOT valid: {e.message}")
-            except ValueError as e:
+        for report, (qa_ids, error) in results:
+            report_count += 1
+            # Duplicates across reports are checked here, as the reports may have been validated in different processes
+            if not used_ids.isdisjoint(qa_ids):
+                duplicate_id = next(qa["id"] for qa in report["paragraphs"][0]["qas"] if qa["id"] in used_ids)
+                error = f"Duplicate question ID '{duplicate_id}' in report '{report['report_id']}'."
+            else:
+                used_ids.update(qa_ids)
+            if error is not None:
                 invalid_report_count += 1
-                logging.error(f"Report '{report['report_id']}' is NOT valid: {str(e)}")
-        logging.info(f"{invalid_report_count}/{len(dataset['data'])} reports were invalid.")
+                logging.error(f"Report '{report['report_id']}' is NOT valid: {error}")
+        logging.info(f"{invalid_report_count}/{report_count} reports were invalid.")
+
+    def _validate_reports(self, reports, required_fields_validation, num_workers):
+        """Validate the reports one by one, in order, yielding their question-answer IDs and error messages (None if valid)."""
+        if num_workers <= 1:
+            for report in reports:
+                yield self._validate_report_isolated(report, required_fields_validation)
+            return
+
+        chunksize = max(1, len(reports) // (4 * num_workers))
+        with ProcessPoolExecutor(num_workers, initializer=_init_worker, initargs=(self.schema_path,)) as executor:
+            yield from executor.map(
+                partial(_validate_report_worker, required_fields_validation=required_fields_validation),
+                reports, chunksize=chunksize
+            )
+
+    def _validate_report_isolated(self, report, required_fields_validation):
+        """Validate a report on its own, returning its question-answer IDs and the error message (None if valid)."""
+        qa_ids = set()
+        try:
+            self.validate_report(report, required_fields_validation, qa_ids)
+        except ValidationError as e:
+            return qa_ids, e.message
+        except ValueError as e:
+            return qa_ids, str(e)
+        return qa_ids, None
 
     def question_includes_datatype(self, question_id: str, dtype: str):
         """
@@ -230,17 +475,31 @@ class FormDefinition:
         Returns:
             bool: True if the specified data type is present in the options for the question ID, otherwise False.
         """
-        if dtype == "boolean": 
-            return True in self.possible_options[question_id] or False in self.possible_options[question_id]
-        elif dtype == "null": 
-            return None in self.possible_options[question_id]
-        elif dtype == "enum":
-            return any([isinstance(op, str) for op in self.possible_options[question_id]])
-        else:
-            return any(
-                isinstance(op, (FormNumber, FormDate, FormInteger, FormDateTime, FormTime, FormString)) and op.data_type == dtype
-                for op in self.possible_options[question_id]
-            )
+        return bool(self._dtype_masks[question_id] & _TYPE_BITS.get(dtype, 0))
+
+
+# FormDefinition of a validate_dataset worker process
+_worker_form_definition = None
+
+
+def _init_worker(schema_path):
+    """Load the form definition once per worker process."""
+    global _worker_form_definition
+    _worker_form_definition = FormDefinition(schema_path)
+
+
+def _validate_report_worker(report, required_fields_validation):
+    """Validate a report in a worker process, see FormDefinition._validate_report_isolated."""
+    return _worker_form_definition._validate_report_isolated(report, required_fields_validation)
+
+
+def _is_valid_date(year, month, day):
+    """Check that the matched date exists (e.g. no February 30 or year 0)."""
+    try:
+        date(int(year), int(month), int(day))
+        return True
+    except ValueError:
+        return False
 
 
 class FormDate:
@@ -253,10 +512,17 @@ class FormDate:
         return "FormDate"
 
     def is_valid(self, var):
-        try:
-            return isinstance(var, str) and datetime.strptime(var, "%Y-%m-%d")
-        except ValueError:
+        if not isinstance(var, str):
             return False
+        # Only the canonical "YYYY-MM-DD" shape, fromisoformat accepts other ISO forms strptime did not
+        if len(var) == 10 and var[4] == "-" and var[7] == "-":
+            try:
+                _date_fromisoformat(var)
+                return True
+            except ValueError:
+                pass
+        match = _DATE_RE.fullmatch(var)
+        return match is not None and _is_valid_date(*match.group("Y", "m", "d"))
 
 class FormDateTime:
     data_type = "date-time"
@@ -270,19 +536,15 @@ class FormDateTime:
     def is_valid(self, var):
         if not isinstance(var, str):
             return False
-
-        formats = [
-            "%Y-%m-%dT%H:%M:%S"
-        ]
-
-        for fmt in formats:
+        # Only the canonical "YYYY-MM-DDTHH:MM:SS" shape, fromisoformat accepts other ISO forms strptime did not
+        if len(var) == 19 and var[4] == "-" and var[7] == "-" and var[10] == "T" and var[13] == ":" and var[16] == ":":
             try:
-                datetime.strptime(var, fmt)
+                _datetime_fromisoformat(var)
                 return True
             except ValueError:
-                continue
-
-        return False
+                pass
+        match = _DATE_TIME_RE.fullmatch(var)
+        return match is not None and int(match.group("S")) <= 59 and _is_valid_date(*match.group("Y", "m", "d"))
 
 
 class FormInteger:
@@ -342,13 +604,20 @@ class FormTime:
     def is_valid(self, var):
         if not isinstance(var, str):
             return False
-
-        formats = ["%H:%M:%S"]
-        for fmt in formats:
+        # Only the canonical "HH:MM:SS" shape, fromisoformat accepts other ISO forms strptime did not
+        if len(var) == 8 and var[2] == ":" and var[5] == ":":
             try:
-                datetime.strptime(var, fmt)
+                _time_fromisoformat(var)
                 return True
             except ValueError:
-                continue
+                pass
+        match = _TIME_RE.fullmatch(var)
+        # strptime patterns allow leap seconds 60 and 61, which datetime rejects
+        return match is not None and int(match.group("S")) <= 59
+
 
-        return False
\ No newline at end of file
+# The stateless options are shared by all questions (and form definitions) instead of creating new ones per schema branch
+_FORM_DATE = FormDate()
+_FORM_DATE_TIME = FormDateTime()
+_FORM_STRING = FormString()
+_FORM_TIME = FormTime()